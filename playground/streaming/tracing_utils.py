@@ -110,11 +110,11 @@ def make_parser_and_maybe_trace():
     if args.trace:
         from opentelemetry import trace
         from opentelemetry.sdk.trace import TracerProvider
-        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
         from opentelemetry.sdk.resources import Resource
 
         trace.set_tracer_provider(TracerProvider(resource=Resource.create({})))
         span_exporter = PrintDurationSpanExporter()
         trace.get_tracer_provider().add_span_processor(  # type: ignore
-            SimpleSpanProcessor(span_exporter)
+            BatchSpanProcessor(span_exporter)
         )
@@ -0,0 +1,44 @@
+from vocode.streaming.models.synthesizer import ElevenLabsSynthesizerConfig
+
+
+def make_synthesizer_config(bucket_name: str) -> ElevenLabsSynthesizerConfig:
+    return ElevenLabsSynthesizerConfig.from_telephone_output_device(
+        index_config={
+            "pinecone_config": {
+                "type": "vector_db_pinecone",
+                "index": "index",
+                "api_key": None,
+                "api_environment": None,
+            },
+            "bucket_name": bucket_name,
+        }
+    )
+
+
+def test_index_config_is_shared_between_synthesizer_configs():
+    first = make_synthesizer_config("bucket")
+    second = make_synthesizer_config("bucket")
+    other = make_synthesizer_config("other-bucket")
+
+    assert first.index_config is second.index_config
+    assert first.index_config is not other.index_config
+    assert first.get_cache_key("hi") == second.get_cache_key("hi")
+
+
+def test_synthesizer_config_without_index_round_trips_through_json():
+    config = ElevenLabsSynthesizerConfig.from_telephone_output_device()
+
+    parsed = ElevenLabsSynthesizerConfig.parse_raw(config.json())
+
+    assert parsed.index_config is None
+    assert parsed == config
+
+
+def test_synthesizer_config_with_index_round_trips_through_json():
+    config = make_synthesizer_config("bucket")
+
+    parsed = ElevenLabsSynthesizerConfig.parse_raw(config.json())
+
+    assert parsed.index_config == config.index_config
+    assert parsed.index_config is config.index_config
+    assert parsed.get_cache_key("hi") == config.get_cache_key("hi")
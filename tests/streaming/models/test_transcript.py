@@ -94,3 +94,21 @@ HUMAN: Send me an email you bot. My email is du@de.com
 ACTION_WORKER: params={'recipient_email': 'du@de.com', 'body': 'What up', 'subject': 'This is the bot'}
 ACTION_WORKER: action_type='action_nylas_send_email' response={'success': True}"""
     )
+
+
+def test_transcript_count_human_messages():
+    transcript = Transcript(
+        event_logs=[
+            Message(sender=Sender.BOT, text="What up"),
+            Message(sender=Sender.HUMAN, text="Hello"),
+        ]
+    )
+    assert transcript.count_human_messages() == 1
+
+    transcript.add_human_message(text="Send me an email", conversation_id="123")
+    transcript.add_bot_message(text="Sure", conversation_id="123")
+    transcript.add_message(
+        message=Message(sender=Sender.HUMAN, text="Thanks"), conversation_id="123"
+    )
+    assert transcript.count_human_messages() == 3
+    assert transcript.copy().count_human_messages() == 3
@@ -0,0 +1,57 @@
+import asyncio
+import threading
+
+import pytest
+
+from vocode.streaming.utils.worker import (
+    AsyncQueueWorker,
+    InterruptibleEvent,
+    PayloadCountingQueue,
+)
+
+
+@pytest.mark.asyncio
+async def test_payload_counting_queue():
+    queue = PayloadCountingQueue(str)
+    queue.put_nowait(InterruptibleEvent("message"))
+    queue.put_nowait(InterruptibleEvent(1))
+    queue.put_nowait(InterruptibleEvent("another message"))
+    assert queue.payload_count == 2
+
+    await queue.get()
+    assert queue.payload_count == 1
+    queue.get_nowait()
+    assert queue.payload_count == 1
+    queue.get_nowait()
+    assert queue.payload_count == 0
+    assert queue.empty()
+
+
+class NoopQueueWorker(AsyncQueueWorker):
+    async def process(self, item):
+        pass
+
+
+def test_async_queue_worker_stops_when_closed_after_its_loop():
+    async def start_worker() -> NoopQueueWorker:
+        worker = NoopQueueWorker(input_queue=asyncio.Queue(), output_queue=asyncio.Queue())
+        worker.start()
+        # let the worker block on input_queue.get()
+        await asyncio.sleep(0)
+        return worker
+
+    loop = asyncio.new_event_loop()
+    worker = loop.run_until_complete(start_worker())
+    loop.close()
+
+    # what happens when a task that is still pending gets garbage collected after its loop closed
+    def close_worker_coroutine():
+        try:
+            worker.worker_task.get_coro().close()
+        except RuntimeError:
+            pass
+
+    closer = threading.Thread(target=close_worker_coroutine, daemon=True)
+    closer.start()
+    closer.join(timeout=5)
+    assert not closer.is_alive()
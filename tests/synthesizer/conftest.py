@@ -1,10 +1,16 @@
+import ctypes
+import types
+
+import azure.cognitiveservices.speech as speechsdk
 import pytest
 from aioresponses import aioresponses, CallbackResult
 from vocode.streaming.models.audio_encoding import AudioEncoding
 from vocode.streaming.models.synthesizer import (
+    AzureSynthesizerConfig,
     ElevenLabsSynthesizerConfig,
     PlayHtSynthesizerConfig,
 )
+from vocode.streaming.synthesizer.azure_synthesizer import AzureSynthesizer
 import re
 from vocode.streaming.synthesizer.eleven_labs_synthesizer import (
     ElevenLabsSynthesizer,
@@ -125,3 +131,68 @@ async def fixture_play_ht_synthesizer_env_api_key():
     os.environ["PLAY_HT_API_KEY"] = MOCK_API_KEY
     os.environ["PLAY_HT_USER_ID"] = MOCK_USER_ID
     return PlayHtSynthesizer(PlayHtSynthesizerConfig(**params))
+
+
+# Azure Setup
+
+MOCK_AZURE_AUDIO = bytes(range(256)) * 10
+
+
+class FakeAzureSpeechSynthesizer:
+    # constructing the real SpeechSynthesizer needs the platform libraries to reach Azure
+    def __init__(self, speech_config, audio_config):
+        self.word_boundary_callbacks = []
+        self.synthesis_word_boundary = types.SimpleNamespace(
+            connect=self.word_boundary_callbacks.append
+        )
+        self.audio_data = MOCK_AZURE_AUDIO
+        self.final_status = speechsdk.StreamStatus.AllData
+        self.num_syntheses = 0
+
+    def start_speaking_ssml_async(self, ssml: str):
+        self.num_syntheses += 1
+        event = types.SimpleNamespace(
+            text="Hello",
+            text_offset=ssml.index("Hello"),
+            audio_offset=1_000_000,
+            boundary_type="Word",
+        )
+        for callback in self.word_boundary_callbacks:
+            callback(event)
+        result = types.SimpleNamespace(
+            audio_data=self.audio_data, final_status=self.final_status
+        )
+        return types.SimpleNamespace(get=lambda: result)
+
+
+class FakeAzureAudioDataStream:
+    def __init__(self, result):
+        self.result = result
+        self.position = 0
+        self.status = speechsdk.StreamStatus.PartialData
+
+    def read_data(self, audio_buffer: bytes) -> int:
+        chunk = self.result.audio_data[self.position : self.position + len(audio_buffer)]
+        # like the SDK, fill the caller's buffer in place
+        ctypes.memmove(audio_buffer, chunk, len(chunk))
+        self.position += len(chunk)
+        if len(chunk) < len(audio_buffer):
+            self.status = self.result.final_status
+        return len(chunk)
+
+
+@pytest.fixture
+def mock_azure_speech_sdk(monkeypatch):
+    monkeypatch.setattr(speechsdk, "SpeechSynthesizer", FakeAzureSpeechSynthesizer)
+    monkeypatch.setattr(speechsdk, "AudioDataStream", FakeAzureAudioDataStream)
+    AzureSynthesizer.speech_cache.clear()
+    yield
+    AzureSynthesizer.speech_cache.clear()
+
+
+def create_azure_synthesizer() -> AzureSynthesizer:
+    return AzureSynthesizer(
+        AzureSynthesizerConfig(**DEFAULT_PARAMS),
+        azure_speech_key=MOCK_API_KEY,
+        azure_speech_region="eastus",
+    )
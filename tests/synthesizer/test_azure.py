@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+import azure.cognitiveservices.speech as speechsdk
+import pytest
+
+from vocode.streaming.models.message import BaseMessage
+from vocode.streaming.synthesizer.base_synthesizer import SynthesisResult
+from vocode.streaming.synthesizer.azure_synthesizer import AzureSynthesizer
+from tests.synthesizer.conftest import MOCK_AZURE_AUDIO, create_azure_synthesizer
+
+
+async def collect_chunks(synthesis_result: SynthesisResult):
+    return [
+        (chunk_result.chunk, chunk_result.is_last_chunk)
+        async for chunk_result in synthesis_result.chunk_generator
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_conversations_do_not_wait_on_each_other(
+    mock_azure_speech_sdk,
+):
+    # more conversations than there are threads in one synthesizer's pool
+    num_conversations = 5
+    synthesizers = [create_azure_synthesizer() for _ in range(num_conversations)]
+    # every synthesis blocks until all of them are running at once
+    barrier = threading.Barrier(num_conversations, timeout=5)
+    for synthesizer in synthesizers:
+        speak = synthesizer.synthesizer.start_speaking_ssml_async
+
+        def speak_together(ssml, speak=speak):
+            barrier.wait()
+            return speak(ssml)
+
+        synthesizer.synthesizer.start_speaking_ssml_async = speak_together
+    try:
+        synthesis_results = await asyncio.gather(
+            *(
+                synthesizer.create_speech(BaseMessage(text=f"Hello {i}"), 1024)
+                for i, synthesizer in enumerate(synthesizers)
+            )
+        )
+        for synthesis_result in synthesis_results:
+            assert b"".join(
+                chunk for chunk, _ in await collect_chunks(synthesis_result)
+            )
+    finally:
+        for synthesizer in synthesizers:
+            await synthesizer.tear_down()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "audio_data",
+    [MOCK_AZURE_AUDIO, MOCK_AZURE_AUDIO[:2048]],
+    ids=["partial_last_chunk", "whole_chunks_only"],
+)
+async def test_cached_speech_replays_live_chunks(mock_azure_speech_sdk, audio_data):
+    synthesizer = create_azure_synthesizer()
+    synthesizer.synthesizer.audio_data = audio_data
+    message = BaseMessage(text="Hello, world!")
+    try:
+        live_result = await synthesizer.create_speech(message, 1024)
+        live_chunks = await collect_chunks(live_result)
+        assert len(AzureSynthesizer.speech_cache) == 1
+
+        cached_result = await synthesizer.create_speech(message, 1024)
+        cached_chunks = await collect_chunks(cached_result)
+        assert synthesizer.synthesizer.num_syntheses == 1
+
+        assert cached_chunks == live_chunks
+        assert b"".join(chunk for chunk, _ in cached_chunks) == audio_data
+        for seconds in (0.05, 0.2):
+            assert cached_result.get_message_up_to(
+                seconds
+            ) == live_result.get_message_up_to(seconds)
+    finally:
+        await synthesizer.tear_down()
+
+
+@pytest.mark.asyncio
+async def test_incomplete_speech_is_not_cached(mock_azure_speech_sdk):
+    synthesizer = create_azure_synthesizer()
+    synthesizer.synthesizer.final_status = speechsdk.StreamStatus.Canceled
+    message = BaseMessage(text="Hello, world!")
+    try:
+        for _ in range(2):
+            await collect_chunks(await synthesizer.create_speech(message, 1024))
+        assert len(AzureSynthesizer.speech_cache) == 0
+        assert synthesizer.synthesizer.num_syntheses == 2
+    finally:
+        await synthesizer.tear_down()
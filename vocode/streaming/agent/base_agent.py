@@ -48,6 +48,7 @@ from vocode.streaming.utils.worker import (
     InterruptibleEvent,
     InterruptibleEventFactory,
     InterruptibleWorker,
+    PayloadCountingQueue,
 )
 
 if TYPE_CHECKING:
@@ -161,9 +162,10 @@ class BaseAgent(AbstractAgent[AgentConfigType], InterruptibleWorker):
         self.input_queue: asyncio.Queue[
             InterruptibleEvent[AgentInput]
         ] = asyncio.Queue()
-        self.output_queue: asyncio.Queue[
+        # counts pending AgentResponseMessages so the conversation can tell if there is more to synthesize
+        self.output_queue: PayloadCountingQueue[
             InterruptibleAgentResponseEvent[AgentResponse]
-        ] = asyncio.Queue()
+        ] = PayloadCountingQueue(AgentResponseMessage)
         AbstractAgent.__init__(self, agent_config=agent_config)
         InterruptibleWorker.__init__(
             self,
@@ -208,7 +210,7 @@ class BaseAgent(AbstractAgent[AgentConfigType], InterruptibleWorker):
 
     def get_output_queue(
         self,
-    ) -> asyncio.Queue[InterruptibleAgentResponseEvent[AgentResponse]]:
+    ) -> PayloadCountingQueue[InterruptibleAgentResponseEvent[AgentResponse]]:
         return self.output_queue
 
     def create_goodbye_detection_task(self, message: str) -> asyncio.Task:
@@ -1,9 +1,9 @@
 from typing import List, Optional
 from langchain.llms import OpenAI
 from langchain.prompts import PromptTemplate
-from pydantic import BaseModel
 
 from vocode import getenv
+from vocode.streaming.models.synthesizer import BotSentiment
 
 TEMPLATE = """
 Read the following conversation classify the final emotion of the Bot as one of [{emotions}].
@@ -15,11 +15,6 @@ Output the degree of emotion as a value between 0 and 1 in the format EMOTION,DE
 """
 
 
-class BotSentiment(BaseModel):
-    emotion: Optional[str] = None
-    degree: float = 0.0
-
-
 class BotSentimentAnalyser:
     def __init__(
         self,
@@ -6,6 +6,7 @@ from vocode.streaming.transcriber.base_transcriber import Transcription
 from vocode.streaming.utils.worker import (
     InterruptibleAgentResponseEvent,
     InterruptibleEvent,
+    PayloadCountingQueue,
 )
 import websockets
 from websockets.client import (
@@ -36,7 +37,7 @@ NUM_RESTARTS = 5
 
 class WebSocketUserImplementedAgent(BaseAgent[WebSocketUserImplementedAgentConfig]):
     input_queue: asyncio.Queue[InterruptibleEvent[AgentInput]]
-    output_queue: asyncio.Queue[InterruptibleAgentResponseEvent[AgentResponse]]
+    output_queue: PayloadCountingQueue[InterruptibleAgentResponseEvent[AgentResponse]]
 
     def __init__(
         self,
@@ -1,7 +1,34 @@
+from typing import Tuple
+from weakref import WeakValueDictionary
+
 from vocode.streaming.models.vector_db import PineconeConfig
 
 from .model import BaseModel
 
 class IndexConfig(BaseModel):
+    # pydantic models are not weak-referenceable by default; needed for interning below
+    __slots__ = ("__weakref__",)
+
     pinecone_config: PineconeConfig
-    bucket_name: str
\ No newline at end of file
+    bucket_name: str
+
+    class Config:
+        # index configs are shared between conversations, so they must not be mutated
+        allow_mutation = False
+
+    def get_key(self) -> Tuple:
+        return tuple(self.pinecone_config.dict().items()), self.bucket_name
+
+    @classmethod
+    def intern(cls, index_config: "IndexConfig") -> "IndexConfig":
+        """Returns the live IndexConfig with the same settings if there is one,
+        so conversations using the same index share a single instance"""
+        key = index_config.get_key()
+        existing = _index_configs.get(key)
+        if existing is not None:
+            return existing
+        _index_configs[key] = index_config
+        return index_config
+
+
+_index_configs: "WeakValueDictionary[Tuple, IndexConfig]" = WeakValueDictionary()
@@ -107,6 +107,13 @@ class SynthesizerConfig(TypedModel, type=SynthesizerType.BASE.value):
     class Config:
         arbitrary_types_allowed = True
 
+    @validator("index_config")
+    def share_index_config(cls, v):
+        # also runs for an explicit null, e.g. when parsing a config dumped with .json()
+        if v is None:
+            return v
+        return IndexConfig.intern(v)
+
     @classmethod
     def from_output_device(cls, output_device: BaseOutputDevice, **kwargs):
         return cls(
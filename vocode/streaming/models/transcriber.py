@@ -116,6 +116,8 @@ class DeepgramTranscriberConfig(TranscriberConfig, type=TranscriberType.DEEPGRAM
     filler_words: Optional[str] = None
     keywords: Optional[list] = None
     deepgram_endpointing: Optional[int] = None
+    # interim transcriptions that arrive sooner than this after the last one sent are dropped, 0 sends all of them
+    min_interim_transcription_interval_seconds: float = 0
 
 
 class GladiaTranscriberConfig(TranscriberConfig, type=TranscriberType.GLADIA.value):
@@ -1,6 +1,6 @@
 import time
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from enum import Enum
 from vocode.streaming.models.actions import ActionInput, ActionOutput
 from vocode.streaming.models.events import ActionEvent, Sender, Event, EventType
@@ -51,10 +51,18 @@ class Transcript(BaseModel):
     event_logs: List[EventLog] = []
     start_time: float = Field(default_factory=time.time)
     events_manager: Optional[EventsManager] = None
+    # kept up to date by add_message so count_human_messages doesn't scan event_logs
+    _human_message_count: int = PrivateAttr(default=0)
 
     class Config:
         arbitrary_types_allowed = True
 
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        self._human_message_count = sum(
+            1 for event_log in self.event_logs if event_log.sender == Sender.HUMAN
+        )
+
     def attach_events_manager(self, events_manager: EventsManager):
         self.events_manager = events_manager
 
@@ -86,11 +94,11 @@ class Transcript(BaseModel):
     ):
         timestamp = time.time()
         message = Message(text=text, sender=sender, timestamp=timestamp)
-        self.event_logs.append(message)
-        if publish_to_events_manager:
-            self.maybe_publish_transcript_event_from_message(
-                message=message, conversation_id=conversation_id
-            )
+        self.add_message(
+            message=message,
+            conversation_id=conversation_id,
+            publish_to_events_manager=publish_to_events_manager,
+        )
 
     def add_message(
         self,
@@ -99,6 +107,8 @@ class Transcript(BaseModel):
         publish_to_events_manager: bool = True,
     ):
         self.event_logs.append(message)
+        if message.sender == Sender.HUMAN:
+            self._human_message_count += 1
         if publish_to_events_manager:
             self.maybe_publish_transcript_event_from_message(
                 message=message, conversation_id=conversation_id
@@ -124,11 +134,7 @@ class Transcript(BaseModel):
                 return -1 * (idx + 1), message.to_string()
     
     def count_human_messages(self):
-        count = 0
-        for message in self.event_logs:
-            if message.sender == Sender.HUMAN:
-                count += 1
-        return count
+        return self._human_message_count
 
     def add_action_start_log(self, action_input: ActionInput, conversation_id: str):
         timestamp = time.time()
@@ -64,6 +64,12 @@ class RandomResponseAudioWorker(InterruptibleAgentResponseWorker):
         ):
             await self.interruptible_event.agent_response_tracker.wait()
 
+    def is_active(self) -> bool:
+        # queued events count too: a stop scheduled now would run after they are picked up
+        return (
+            self.current_task is not None and not self.current_task.done()
+        ) or not self.input_queue.empty()
+
     def interrupt_current_random_audio(self):
         # self.logger.debug(f"Interrupting filler audio: {self.name}")
         current_event_interrupted = self.interruptible_event and self.interruptible_event.interrupt()
@@ -333,7 +339,11 @@ class RandomAudioManager:
             self.logger.debug("Terminating backtrack worker")
             self.backtrack_worker.terminate()
 
+    # the stop methods below run on every transcription and synthesis result,
+    # so only schedule a stop for workers that are actually playing something
     def sync_stop_follow_up_audio(self):
+        if self.follow_up_worker is None or not self.follow_up_worker.is_active():
+            return
         try:
             loop = asyncio.get_event_loop()
             loop.create_task(self.stop_follow_up_audio())
@@ -343,9 +353,12 @@ class RandomAudioManager:
     def stop_all_audios(self):
         try:
             loop = asyncio.get_event_loop()
-            loop.create_task(self.stop_follow_up_audio())
-            loop.create_task(self.stop_filler_audio())
-            loop.create_task(self.stop_backtrack_audio())
+            if self.follow_up_worker is not None and self.follow_up_worker.is_active():
+                loop.create_task(self.stop_follow_up_audio())
+            if self.filler_audio_worker is not None and self.filler_audio_worker.is_active():
+                loop.create_task(self.stop_filler_audio())
+            if self.backtrack_worker is not None and self.backtrack_worker.is_active():
+                loop.create_task(self.stop_backtrack_audio())
         except Exception as e:
             self.logger.debug(f"Exception while stopping all audios: {repr(e)}")
 
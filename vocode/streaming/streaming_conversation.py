@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import queue
 import random
 import threading
@@ -12,6 +13,7 @@ import typing
 from vocode.streaming.action.worker import ActionsWorker
 
 from vocode.streaming.agent.bot_sentiment_analyser import (
+    BotSentiment,
     BotSentimentAnalyser,
 )
 from vocode.streaming.agent.chat_gpt_agent import ChatGPTAgent
@@ -75,19 +77,25 @@ from vocode.streaming.utils.worker import (
     InterruptibleEventFactory,
     InterruptibleAgentResponseEvent,
     InterruptibleWorker,
+    PayloadCountingQueue,
 )
 from vocode.streaming.utils.duration_from_message import should_finish_sentence
 from vocode.streaming.response_worker.random_response import RandomAudioManager
 
 from opentelemetry import trace, metrics
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.trace import TracerProvider, Span
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.trace import Span
 tracer = trace.get_tracer(__name__)
 meter = metrics.get_meter(__name__)
 
 OutputDeviceType = TypeVar("OutputDeviceType", bound=BaseOutputDevice)
 
+# Verbal cues that indicate no interruption
+VERBAL_CUES = (
+    "uh", "um", "mhm",
+    "yes", "yeah", "okay",
+    "i see", "i understand", "go on", "go ahead",
+)
+
 
 class StreamingConversation(Generic[OutputDeviceType]):
     class QueueingInterruptibleEventFactory(InterruptibleEventFactory):
@@ -100,7 +108,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
             interruptible_event: InterruptibleEvent = (
                 super().create_interruptible_event(payload, is_interruptible)
             )
-            self.conversation.interruptible_events.put_nowait(interruptible_event)
+            self.conversation.interruptible_events.append(interruptible_event)
             return interruptible_event
 
         def create_interruptible_agent_response_event(
@@ -114,7 +122,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
                 is_interruptible=is_interruptible,
                 agent_response_tracker=agent_response_tracker,
             )
-            self.conversation.interruptible_events.put_nowait(interruptible_event)
+            self.conversation.interruptible_events.append(interruptible_event)
             return interruptible_event
 
     class TranscriptionsWorker(AsyncQueueWorker):
@@ -137,7 +145,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
         async def process(self, transcription: Transcription):
             self.conversation.mark_last_action_timestamp()
             self.conversation.current_transcription_is_interrupt = transcription.is_interrupt
-            if transcription.message.strip() == "":
+            if not transcription.message or transcription.message.isspace():
                 self.conversation.logger.info("Ignoring empty transcription")
                 return
             
@@ -145,14 +153,14 @@ class StreamingConversation(Generic[OutputDeviceType]):
             if transcription.message == HUMAN_ACTIVITY_DETECTED:
                 self.conversation.logger.info("Got transcription: Human activity detected")
             if not transcription.is_final:
-                self.conversation.logger.debug("Got partial transcription: {}".format(transcription.message))
+                self.conversation.logger.debug("Got partial transcription: %s", transcription.message)
             if transcription.is_final:
                 if not self.conversation.human_has_spoken:
                     self.conversation.human_has_spoken = True
                 self.conversation.logger.debug(
-                    "Got transcription: {}, confidence: {}".format(
-                        transcription.message, transcription.confidence
-                    )
+                    "Got transcription: %s, confidence: %s",
+                    transcription.message,
+                    transcription.confidence,
                 )
 
             # check interruption, if not checking interruption, transcription will always be considered 
@@ -165,7 +173,17 @@ class StreamingConversation(Generic[OutputDeviceType]):
             # self.conversation.logger.debug(f"is_bot_speaking: {self.conversation.is_bot_speaking}")
             # self.conversation.logger.debug(f"is_synthesizing: {self.conversation.is_synthesizing}")
             if should_check_interrupt:
-                self.conversation.logger.debug(f"Checking interrupt for {transcription.message}")
+                # ignore low confidence transcriptions if bot is speaking, before running interrupt detection on them
+                if transcription.confidence < (
+                    self.conversation.transcriber_config.min_interrupt_confidence or 0
+                ):
+                    self.conversation.logger.info(
+                        "Ignoring low confidence transcription: %s, %s",
+                        transcription.message,
+                        transcription.confidence,
+                    )
+                    return
+                self.conversation.logger.debug("Checking interrupt for %s", transcription.message)
                 if self.conversation.is_interrupt(transcription):
                     self.conversation.logger.debug("Conversation interrupted")
                     self.conversation.current_transcription_is_interrupt = (
@@ -179,16 +197,11 @@ class StreamingConversation(Generic[OutputDeviceType]):
                         AgentResponseBacktrackAudio()
                     )
                 else:    
-                    self.conversation.logger.debug(f"Ignoring human utterance - text didn't trigger interruption: {transcription.message}")
-                    return
-            # ignore low confidence transcriptions if bot is speaking
-            if transcription.confidence < self.conversation.transcriber.get_transcriber_config().min_interrupt_confidence:
-                if should_check_interrupt:
-                    self.conversation.logger.info(
-                        f"Ignoring low confidence transcription: {transcription.message}, {transcription.confidence}"
+                    self.conversation.logger.debug(
+                        "Ignoring human utterance - text didn't trigger interruption: %s",
+                        transcription.message,
                     )
                     return
-
             transcription.is_interrupt = (
                 self.conversation.current_transcription_is_interrupt
             )
@@ -200,13 +213,12 @@ class StreamingConversation(Generic[OutputDeviceType]):
                 )
                 if detected_human_voice:
                     return
-                # we use getattr here to avoid the dependency cycle between VonageCall and StreamingConversation
                 event = self.interruptible_event_factory.create_interruptible_event(
                     TranscriptionAgentInput(
                         transcription=transcription,
                         conversation_id=self.conversation.id,
-                        vonage_uuid=getattr(self.conversation, "vonage_uuid", None),
-                        twilio_sid=getattr(self.conversation, "twilio_sid", None),
+                        vonage_uuid=self.conversation.vonage_uuid,
+                        twilio_sid=self.conversation.twilio_sid,
                     )
                 )
                 self.output_queue.put_nowait(event)
@@ -215,7 +227,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
 
         def __init__(
             self,
-            input_queue: asyncio.Queue[InterruptibleAgentResponseEvent[AgentResponse]],
+            input_queue: PayloadCountingQueue[InterruptibleAgentResponseEvent[AgentResponse]],
             output_queue: asyncio.Queue[
                 InterruptibleAgentResponseEvent[Tuple[BaseMessage, SynthesisResult]]
             ],
@@ -226,26 +238,20 @@ class StreamingConversation(Generic[OutputDeviceType]):
                 input_queue=input_queue,
                 output_queue=output_queue,
             )
-            self.input_queue: asyncio.Queue[InterruptibleAgentResponseEvent[AgentResponse]]  = input_queue
+            self.input_queue: PayloadCountingQueue[InterruptibleAgentResponseEvent[AgentResponse]] = input_queue
             self.output_queue = output_queue
             self.conversation = conversation
             self.interruptible_event_factory = interruptible_event_factory
             self.chunk_size = (
-                get_chunk_size_per_second(
-                    self.conversation.synthesizer.get_synthesizer_config().audio_encoding,
-                    self.conversation.synthesizer.get_synthesizer_config().sampling_rate,
-                )
+                self.conversation.chunk_size_per_second
                 * TEXT_TO_SPEECH_CHUNK_SIZE_SECONDS
             )
-            self.use_index: bool = bool(getattr(self.conversation.synthesizer.get_synthesizer_config(),
+            self.use_index: bool = bool(getattr(self.conversation.synthesizer_config,
                                      'index_config',
                                       None)
                                      )
         def input_queue_has_agent_response_message(self):
-            for item in self.input_queue._queue:
-                if isinstance(item.payload, AgentResponseMessage):
-                    return True
-            return False
+            return self.input_queue.payload_count > 0
             
         async def process(self, item: InterruptibleAgentResponseEvent[AgentResponse]):
             if not self.conversation.synthesis_enabled:
@@ -285,7 +291,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
                                         
                     if should_send_backtrack_audio:
                         self.conversation.logger.debug("Sending backtrack audio in AgentResponsesWorker")
-                        self.conversation.random_audio_manager.sync_send_backtrack_audio(asyncio.Event())
+                        self.conversation.random_audio_manager.sync_send_backtrack_audio(None)
                     return
 
                 if isinstance(agent_response, AgentResponseStop):
@@ -294,9 +300,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
                     await self.conversation.terminate()
                     return
                                
-                agent_response_message = typing.cast(
-                    AgentResponseMessage, agent_response
-                )
+                agent_response_message: AgentResponseMessage = agent_response  # type: ignore[assignment]
 
                 self.conversation.first_synthesis_span = tracer.start_span(
                     "conversation.synthesizer.create_first_speech"
@@ -363,9 +367,9 @@ class StreamingConversation(Generic[OutputDeviceType]):
                     not self.conversation.sent_initial_message
                     and not self.conversation.human_has_spoken
                 ):
-                    initial_delay = self.conversation.agent.get_agent_config().initial_message_delay_seconds
+                    initial_delay = self.conversation.agent_config.initial_message_delay_seconds
                     if initial_delay:
-                        elapsed_time = time.time() - self.conversation.call_start_time
+                        elapsed_time = time.monotonic() - self.conversation.call_start_time
                         remaining_time = initial_delay - elapsed_time
                         # if the remaining time is positive, delay the initial message by that amount of time
                         if remaining_time > 0:
@@ -389,8 +393,8 @@ class StreamingConversation(Generic[OutputDeviceType]):
                 self.conversation.is_interrupted = cut_off
                 # set flag to check if there is more to say
                 self.conversation.is_bot_speaking = (
-                    not self.input_queue.empty()
-                    and not self.conversation.is_interrupted
+                    not cut_off
+                    and not self.input_queue.empty()
                 )
                 if not self.conversation.bot_has_spoken:
                     if (not cut_off) or (len(message_sent) > 5):
@@ -406,7 +410,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
                     self.conversation.agent.update_last_bot_message_on_cut_off(
                         message_sent
                     )
-                if self.conversation.agent.agent_config.end_conversation_on_goodbye:
+                if self.conversation.agent_config.end_conversation_on_goodbye:
                     goodbye_detected_task = (
                         self.conversation.agent.create_goodbye_detection_task(
                             message_sent
@@ -426,7 +430,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
                     self.conversation.human_has_spoken and
                     not self.conversation.is_bot_speaking and 
                     not self.conversation.is_synthesizing and
-                    self.conversation.agent.get_agent_config().send_follow_up_audio
+                    self.conversation.agent_config.send_follow_up_audio
                 )
                 if should_send_follow_up:
                     self.conversation.logger.debug("Sending Follow Up to AgentResponseWorker.")
@@ -457,8 +461,17 @@ class StreamingConversation(Generic[OutputDeviceType]):
         self.agent = agent
         self.synthesizer = synthesizer
         self.synthesis_enabled = True
+        # configs are read on every event, so resolve them once
+        self.agent_config = self.agent.get_agent_config()
+        self.synthesizer_config = self.synthesizer.get_synthesizer_config()
+        self.transcriber_config = self.transcriber.get_transcriber_config()
+        self.chunk_size_per_second = get_chunk_size_per_second(
+            self.synthesizer_config.audio_encoding,
+            self.synthesizer_config.sampling_rate,
+        )
 
-        self.interruptible_events: queue.Queue[InterruptibleEvent] = queue.Queue()
+        # only touched from the event loop, so a deque is enough (no queue.Queue locking)
+        self.interruptible_events: typing.Deque[InterruptibleEvent] = deque()
         self.interruptible_event_factory = self.QueueingInterruptibleEventFactory(
             conversation=self
         )
@@ -483,7 +496,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
         )
         self.random_audio_manager: RandomAudioManager = RandomAudioManager(conversation=self)
         self.actions_worker = None
-        if self.agent.get_agent_config().actions:
+        if self.agent_config.actions:
             self.actions_worker = ActionsWorker(
                 input_queue=self.agent.actions_queue,
                 output_queue=self.agent.get_input_queue(),
@@ -500,10 +513,12 @@ class StreamingConversation(Generic[OutputDeviceType]):
         self.per_chunk_allowance_seconds = per_chunk_allowance_seconds
         self.transcript = Transcript()
         self.transcript.attach_events_manager(self.events_manager)
-        self.bot_sentiment = self.synthesizer.get_synthesizer_config().initial_bot_sentiment
-        if self.agent.get_agent_config().track_bot_sentiment:
+        self.bot_sentiment: Optional[BotSentiment] = (
+            self.synthesizer_config.initial_bot_sentiment
+        )
+        if self.agent_config.track_bot_sentiment:
             self.sentiment_config = (
-                self.synthesizer.get_synthesizer_config().sentiment_config
+                self.synthesizer_config.sentiment_config
             )
             if not self.sentiment_config:
                 self.sentiment_config = SentimentConfig()
@@ -525,12 +540,17 @@ class StreamingConversation(Generic[OutputDeviceType]):
         self.call_start_time: Optional[float] = None
         self.mark_last_action_timestamp()
 
-        self.check_for_idle_task: Optional[asyncio.Task] = None
+        self.check_for_idle_handle: Optional[asyncio.TimerHandle] = None
+        self.idle_terminate_task: Optional[asyncio.Task] = None
         self.track_bot_sentiment_task: Optional[asyncio.Task] = None
         self.initial_message_task: Optional[asyncio.Task] = None
 
         self.current_transcription_is_interrupt: bool = False
 
+        # set by VonageCall / TwilioCall after this constructor runs
+        self.vonage_uuid: Optional[str] = None
+        self.twilio_sid: Optional[str] = None
+
         # tracing
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
@@ -544,7 +564,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
             started_event: Optional[asyncio.Event] = None,
             mark_ready: Optional[Callable[[], Awaitable[None]]] = None
         ):
-        self.call_start_time = time.time()
+        self.call_start_time = time.monotonic()
         self.transcriber.start()
         self.transcriptions_worker.start()
         self.agent_responses_worker.start()
@@ -560,7 +580,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
 
         self.agent.start()
         self.agent.attach_transcript(self.transcript)
-        initial_message = self.agent.get_agent_config().initial_message
+        initial_message = self.agent_config.initial_message
         if initial_message:
             self.initial_message_task = asyncio.create_task(self.send_initial_message(initial_message))
         self.active = True
@@ -568,20 +588,16 @@ class StreamingConversation(Generic[OutputDeviceType]):
             started_event.set()
         if mark_ready:
             await mark_ready()
-        # bluberry modification: added self.agent.get_agent_config().track_bot_sentiment 
-        # to the following two if statements
+        # bluberry modification: added self.agent.get_agent_config().track_bot_sentiment
+        # to the following condition
         if (
-            self.synthesizer.get_synthesizer_config().sentiment_config 
-            and self.agent.get_agent_config().track_bot_sentiment
+            self.synthesizer_config.sentiment_config
+            and self.agent_config.track_bot_sentiment
         ):
-            await self.update_bot_sentiment()
-       
-        if (self.synthesizer.get_synthesizer_config().sentiment_config 
-                and self.agent.get_agent_config().track_bot_sentiment):
             self.track_bot_sentiment_task = asyncio.create_task(
                 self.track_bot_sentiment()
             )
-        self.check_for_idle_task = asyncio.create_task(self.check_for_idle())
+        self.check_for_idle()
         if len(self.events_manager.subscriptions) > 0:
             self.events_task = asyncio.create_task(self.events_manager.start())
 
@@ -592,7 +608,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
                 agent_response_event = (
                     self.interruptible_event_factory.create_interruptible_agent_response_event(
                         AgentResponseMessage(message=initial_message),
-                        is_interruptible=self.agent.get_agent_config().interrupt_initial_message,
+                        is_interruptible=self.agent_config.interrupt_initial_message,
                         agent_response_tracker=initial_message_tracker,
                     )
                 )
@@ -603,30 +619,44 @@ class StreamingConversation(Generic[OutputDeviceType]):
             self.sent_initial_message = True
             return
 
-    async def check_for_idle(self):
-        """Terminates the conversation after allowed_idle_time_seconds seconds if no activity is detected"""
-        while self.is_active():
-            if time.time() - self.last_action_timestamp > (
-                self.agent.get_agent_config().allowed_idle_time_seconds
-                or ALLOWED_IDLE_TIME
-            ):
-                self.logger.debug("Conversation idle for too long, terminating")
-                await self.terminate()
-                return
-            await asyncio.sleep(15)
+    def check_for_idle(self):
+        """Terminates the conversation after allowed_idle_time_seconds seconds if no activity is detected
+
+        Runs as a loop timer rather than a polling task: mark_last_action_timestamp stays a plain
+        assignment, and the timer re-arms itself for the remaining time if there was activity since
+        """
+        if not self.is_active():
+            return
+        idle_time_remaining = (
+            self.last_action_timestamp
+            + (self.agent_config.allowed_idle_time_seconds or ALLOWED_IDLE_TIME)
+            - time.monotonic()
+        )
+        if idle_time_remaining > 0:
+            self.check_for_idle_handle = asyncio.get_running_loop().call_later(
+                idle_time_remaining, self.check_for_idle
+            )
+            return
+        self.logger.debug("Conversation idle for too long, terminating")
+        self.idle_terminate_task = asyncio.create_task(self.terminate())
 
     async def track_bot_sentiment(self):
-        """Updates self.bot_sentiment every second based on the current transcript"""
-        prev_transcript = None
+        """Updates self.bot_sentiment every second based on the current transcript
+
+        The initial update runs here too, so start() doesn't wait on the analyser's LLM call
+        """
+        prev_transcript = self.transcript.to_string()
+        await self.update_bot_sentiment(prev_transcript)
         while self.is_active():
             await asyncio.sleep(1)
-            if self.transcript.to_string() != prev_transcript:
-                await self.update_bot_sentiment()
-                prev_transcript = self.transcript.to_string()
+            transcript = self.transcript.to_string()
+            if transcript != prev_transcript:
+                await self.update_bot_sentiment(transcript)
+                prev_transcript = transcript
 
-    async def update_bot_sentiment(self):
+    async def update_bot_sentiment(self, transcript: Optional[str] = None):
         new_bot_sentiment = await self.bot_sentiment_analyser.analyse(
-            self.transcript.to_string()
+            transcript if transcript is not None else self.transcript.to_string()
         )
         if new_bot_sentiment.emotion:
             self.logger.debug("Bot sentiment: %s", new_bot_sentiment)
@@ -647,7 +677,7 @@ class StreamingConversation(Generic[OutputDeviceType]):
         self.synthesizer.ready_synthesizer()
 
     def mark_last_action_timestamp(self):
-        self.last_action_timestamp = time.time()
+        self.last_action_timestamp = time.monotonic()
 
     def broadcast_interrupt(self):
         """Stops all inflight events and cancels all workers that are sending output
@@ -655,15 +685,12 @@ class StreamingConversation(Generic[OutputDeviceType]):
         Returns true if any events were interrupted - which is used as a flag for the agent (is_interrupt)
         """
         num_interrupts = 0
-        while True:
-            try:
-                interruptible_event = self.interruptible_events.get_nowait()
-                if not interruptible_event.is_interrupted():
-                    if interruptible_event.interrupt():
-                        self.logger.debug("Interrupting event")
-                        num_interrupts += 1
-            except queue.Empty:
-                break
+        while self.interruptible_events:
+            interruptible_event = self.interruptible_events.popleft()
+            if not interruptible_event.is_interrupted():
+                if interruptible_event.interrupt():
+                    self.logger.debug("Interrupting event")
+                    num_interrupts += 1
         self.agent.cancel_current_task()
         self.agent_responses_worker.cancel_current_task()
         self.random_audio_manager.stop_all_audios()
@@ -688,27 +715,25 @@ class StreamingConversation(Generic[OutputDeviceType]):
             return True   
         # guarantee minimum confidence in transcription
         if transcription.confidence >= (
-            self.transcriber.get_transcriber_config().min_interrupt_confidence or 0
+            self.transcriber_config.min_interrupt_confidence or 0
         ):
-            message = transcription.message.lower().strip()
-            words = message.split()
-            interruption_threshold = self.transcriber.get_transcriber_config().interruption_word_threshold
-            # Verbal cues that indicate no interruption
-            verbal_cues = ["uh", "um", "mhm", 
-                           "yes", "yeah", "okay", 
-                           "i see", "i understand", "go on", "go ahead"]
-
-            if len(words)==0 or len(words)==1:
+            # split() already drops surrounding whitespace, and case doesn't change the word count,
+            # so the message is only lowercased when the verbal cues need to be scanned
+            num_words = len(transcription.message.split())
+            interruption_threshold = self.transcriber_config.interruption_word_threshold
+
+            if num_words==0 or num_words==1:
                 # No interruption for no words or one word uttered
                 return False
-              
-            if any(cue in message for cue in verbal_cues) and (len(words) <= interruption_threshold):
-                # No interruption for positive verbal cues in short utterances
-                return False
 
-            # Check for interruptions with more than two words
-            if len(words) > interruption_threshold:
+            # Check for interruptions with more than two words, before scanning for cues
+            if num_words > interruption_threshold:
                 return True
+
+            message = transcription.message.lower()
+            if any(cue in message for cue in VERBAL_CUES):
+                # No interruption for positive verbal cues in short utterances
+                return False
             # TODO: implement logic for active listening cues
             return True
         else:
@@ -716,12 +741,17 @@ class StreamingConversation(Generic[OutputDeviceType]):
 
     @staticmethod
     def clear_queue(q: asyncio.Queue, queue_name: str):
+        # items go through get_nowait rather than clearing the queue's internal deque so that
+        # PayloadCountingQueue keeps its count and thread-safe output device queues keep their locking
+        num_cleared = 0
         while not q.empty():
-            logging.debug(f'Clearing queue {queue_name} with size {q.qsize()}')
             try:
                 q.get_nowait()
-            except asyncio.QueueEmpty:
-                continue
+            except (asyncio.QueueEmpty, queue.Empty):
+                break
+            num_cleared += 1
+        if num_cleared:
+            logging.debug("Cleared %s items from queue %s", num_cleared, queue_name)
 
     async def send_speech_to_output(
         self,
@@ -744,67 +774,73 @@ class StreamingConversation(Generic[OutputDeviceType]):
 
         Returns the message that was sent up to, and a flag if the message was cut off
         """
-        if self.transcriber.get_transcriber_config().mute_during_speech:
+        mute_during_speech = self.transcriber_config.mute_during_speech
+        if mute_during_speech:
             self.logger.debug("Muting transcriber")
             self.transcriber.mute()
+        # looked up once rather than on every chunk
+        chunk_size_per_second = self.chunk_size_per_second
+        per_chunk_allowance_seconds = self.per_chunk_allowance_seconds
+        get_message_up_to = synthesis_result.get_message_up_to
         message_sent = message
         cut_off = False
-        chunk_size = seconds_per_chunk * get_chunk_size_per_second(
-            self.synthesizer.get_synthesizer_config().audio_encoding,
-            self.synthesizer.get_synthesizer_config().sampling_rate,
-        )
-
         chunk_idx = 0
         seconds_spoken = 0
-        async for chunk_result in synthesis_result.chunk_generator:
-            if self.first_chunk_flag:
-                self.first_chunk_flag = False
-                self.first_synthesis_span.end()
-            start_time = time.time()
-            speech_length_seconds = seconds_per_chunk * (
-                len(chunk_result.chunk) / chunk_size
-            )
-            seconds_spoken = chunk_idx * seconds_per_chunk
-            if stop_event.is_set() and (not cut_off):
-                self.logger.debug("Stop event triggered, checking if bot should finish sentence.")
-                if should_finish_sentence(message, seconds_spoken):
-                    self.logger.debug("Bot should finish sentence.")
-                    cut_off = True
-                else:
-                    self.logger.debug(
-                        "Interrupted, stopping text to speech after {} chunks".format(
-                            chunk_idx
+        chunk_iterator = synthesis_result.chunk_generator.__aiter__()
+        # keep the next chunk's synthesis in flight while the current chunk plays
+        next_chunk_task = asyncio.ensure_future(chunk_iterator.__anext__())
+        try:
+            while True:
+                try:
+                    chunk_result = await next_chunk_task
+                except StopAsyncIteration:
+                    break
+                next_chunk_task = asyncio.ensure_future(chunk_iterator.__anext__())
+                if self.first_chunk_flag:
+                    self.first_chunk_flag = False
+                    self.first_synthesis_span.end()
+                start_time = time.monotonic()
+                speech_length_seconds = len(chunk_result.chunk) / chunk_size_per_second
+                seconds_spoken = chunk_idx * seconds_per_chunk
+                if stop_event.is_set() and (not cut_off):
+                    self.logger.debug("Stop event triggered, checking if bot should finish sentence.")
+                    if should_finish_sentence(message, seconds_spoken):
+                        self.logger.debug("Bot should finish sentence.")
+                        cut_off = True
+                    else:
+                        self.logger.debug(
+                            "Interrupted, stopping text to speech after %d chunks",
+                            chunk_idx,
                         )
+                        message_sent = f"{get_message_up_to(seconds_spoken)}-"
+                        cut_off = True
+                        break
+
+                if chunk_idx == 0:
+                    if started_event:
+                        started_event.set()
+                self.logger.debug("Sending chunk %d to output device...", chunk_idx)
+                self.output_device.consume_nonblocking(chunk_result.chunk)
+                end_time = time.monotonic()
+                await asyncio.sleep(
+                    max(
+                        speech_length_seconds
+                        - (end_time - start_time)
+                        - per_chunk_allowance_seconds,
+                        0,
                     )
-                    message_sent = f"{synthesis_result.get_message_up_to(seconds_spoken)}-"
-                    cut_off = True
-                    break
-
-            if chunk_idx == 0:
-                if started_event:
-                    started_event.set()
-            self.logger.debug(f"Sending chunk {chunk_idx} to output device...")
-            self.output_device.consume_nonblocking(chunk_result.chunk)
-            end_time = time.time()
-            await asyncio.sleep(
-                max(
-                    speech_length_seconds
-                    - (end_time - start_time)
-                    - self.per_chunk_allowance_seconds,
-                    0,
                 )
-            )
-            self.logger.debug(
-                "Sent chunk {} with size {}".format(chunk_idx, len(chunk_result.chunk))
-            )
-            self.mark_last_action_timestamp()
-            chunk_idx += 1
-            seconds_spoken += seconds_per_chunk
-            if transcript_message:
-                transcript_message.text = synthesis_result.get_message_up_to(
-                    seconds_spoken
+                self.logger.debug(
+                    "Sent chunk %d with size %d", chunk_idx, len(chunk_result.chunk)
                 )
-        if self.transcriber.get_transcriber_config().mute_during_speech:
+                self.mark_last_action_timestamp()
+                chunk_idx += 1
+                seconds_spoken += seconds_per_chunk
+                if transcript_message:
+                    transcript_message.text = get_message_up_to(seconds_spoken)
+        finally:
+            next_chunk_task.cancel()
+        if mute_during_speech:
             self.logger.debug("Unmuting transcriber")
             self.transcriber.unmute()
         if transcript_message:
@@ -824,18 +860,23 @@ class StreamingConversation(Generic[OutputDeviceType]):
         if not self.initial_message_task.done():
             self.logger.debug("Terminating initial_message Task")
             self.initial_message_task.cancel()
-        if self.check_for_idle_task:
-            self.logger.debug("Terminating check_for_idle Task")
-            self.check_for_idle_task.cancel()
+        if self.check_for_idle_handle:
+            self.logger.debug("Cancelling check_for_idle timer")
+            self.check_for_idle_handle.cancel()
         if self.track_bot_sentiment_task:
             self.logger.debug("Terminating track_bot_sentiment Task")
             self.track_bot_sentiment_task.cancel()
+        # the async teardowns don't depend on each other, so they run concurrently
+        # while the workers below are cancelled
+        self.logger.debug("Tearing down synthesizer")
+        tear_down_synthesizer_task = asyncio.create_task(self.synthesizer.tear_down())
+        self.logger.debug("Terminating speech transcriber")
+        terminate_transcriber_task = asyncio.create_task(self.transcriber.terminate())
+        teardown_tasks = [tear_down_synthesizer_task, terminate_transcriber_task]
         if self.events_manager and self.events_task:
             self.logger.debug("Terminating events Task")
             self.events_task.cancel()
-            await self.events_manager.flush()
-        self.logger.debug("Tearing down synthesizer")
-        tear_down_synthesizer_task = asyncio.create_task(self.synthesizer.tear_down())
+            teardown_tasks.append(asyncio.create_task(self.events_manager.flush()))
         self.logger.debug("Terminating agent")
         if (
             isinstance(self.agent, ChatGPTAgent)
@@ -845,12 +886,12 @@ class StreamingConversation(Generic[OutputDeviceType]):
             # but it is done here because `vector_db.tear_down()` is async and
             # `agent.terminate()` is not async.
             self.logger.debug("Terminating vector db")
-            await self.agent.vector_db.tear_down()
+            teardown_tasks.append(
+                asyncio.create_task(self.agent.vector_db.tear_down())
+            )
         self.agent.terminate()
         self.logger.debug("Terminating output device")
         self.output_device.terminate()
-        self.logger.debug("Terminating speech transcriber")
-        terminate_transcriber_task = asyncio.create_task(self.transcriber.terminate())
         self.logger.debug("Terminating transcriptions worker")
         self.transcriptions_worker.terminate()
         self.logger.debug("Terminating final transcriptions worker")
@@ -862,10 +903,8 @@ class StreamingConversation(Generic[OutputDeviceType]):
         if self.actions_worker is not None:
             self.logger.debug("Terminating actions worker")
             self.actions_worker.terminate()
-        await terminate_transcriber_task
-        self.logger.debug("Terminated speech transcriber")
-        await tear_down_synthesizer_task
-        self.logger.debug("Terminated synthesizer")
+        await asyncio.gather(*teardown_tasks)
+        self.logger.debug("Terminated speech transcriber and synthesizer")
         self.logger.debug("Successfully terminated")
 
     def is_active(self):
@@ -1,12 +1,24 @@
 import asyncio
+import bisect
 from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 import re
-from typing import Dict, Any, List, Optional, Tuple
-import wave
+import threading
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
 from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 import aiohttp
+from cachetools import LRUCache
 from vocode import getenv
 from opentelemetry.context.context import Context
 
@@ -31,7 +43,9 @@ from vocode.streaming.models.agent import (
 )
 from vocode.streaming.models.audio_encoding import AudioEncoding
 from vocode.streaming.utils.cache import RedisRenewableTTLCache
-import azure.cognitiveservices.speech as speechsdk
+
+if TYPE_CHECKING:
+    import azure.cognitiveservices.speech as speechsdk
 
 
 NAMESPACES = {
@@ -42,27 +56,71 @@ NAMESPACES = {
 ElementTree.register_namespace("", NAMESPACES[""])
 ElementTree.register_namespace("mstts", NAMESPACES["mstts"])
 
+PUNCTUATION_RE = re.compile(r"[\.\,\:\;\-\—]+")
+WORD_CHARACTER_RE = re.compile(r"\w")
+# stands in for the message text when serializing a reusable SSML template
+SSML_TEXT_PLACEHOLDER = "\x00"
+
+# threads per AzureSynthesizer: chunk reads of the utterance being played can overlap with
+# synthesis of the next one, and since each conversation has its own synthesizer, concurrent
+# conversations never wait on each other's blocking SDK calls
+AZURE_SYNTHESIZER_THREAD_POOL_SIZE = 2
+# how many filler phrases a synthesizer warms up at once, at most one per thread
+FILLER_AUDIO_SYNTHESIS_CONCURRENCY = AZURE_SYNTHESIZER_THREAD_POOL_SIZE
+
+
+def read_audio_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def write_audio_file(path: str, audio_data: bytes):
+    with open(path, "wb") as f:
+        f.write(audio_data)
+
 
 class WordBoundaryEventPool:
-    def __init__(self):
-        self.events = []
+    """Word boundary events of one synthesis, kept sorted by audio offset as they arrive"""
+
+    def __init__(self, events: Optional[List[Dict[str, Any]]] = None):
+        # events must already be sorted by audio offset
+        self.events: List[Dict[str, Any]] = list(events or [])
+        self.audio_offsets: List[float] = [
+            event["audio_offset"] for event in self.events
+        ]
+        # events are added from the SDK's callback thread while being read on the event loop
+        self.lock = threading.Lock()
 
     def add(self, event):
-        self.events.append(
-            {
-                "text": event.text,
-                "text_offset": event.text_offset,
-                "audio_offset": (event.audio_offset + 5000) / (10000 * 1000),
-                "boudary_type": event.boundary_type,
-            }
-        )
+        audio_offset = (event.audio_offset + 5000) / (10000 * 1000)
+        with self.lock:
+            # the SDK reports boundaries in order, so this is almost always an append
+            idx = bisect.bisect_right(self.audio_offsets, audio_offset)
+            self.audio_offsets.insert(idx, audio_offset)
+            self.events.insert(
+                idx,
+                {
+                    "text": event.text,
+                    "text_offset": event.text_offset,
+                    "audio_offset": audio_offset,
+                    "boudary_type": event.boundary_type,
+                },
+            )
 
-    def get_events_sorted(self):
-        return sorted(self.events, key=lambda event: event["audio_offset"])
+    def get_first_event_after(self, seconds: float) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            idx = bisect.bisect_right(self.audio_offsets, seconds)
+            return self.events[idx] if idx < len(self.events) else None
 
 
 class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
     OFFSET_MS = 100
+    SPEECH_CACHE_MAX_BYTES = 32 * 1024 * 1024
+    # (audio data, word boundary events) for recently synthesized SSML, shared across conversations
+    # so that repeated phrases skip the round trip to Azure; bounded by the total bytes of audio
+    speech_cache: LRUCache = LRUCache(
+        maxsize=SPEECH_CACHE_MAX_BYTES, getsizeof=lambda value: len(value[0])
+    )
 
     def __init__(
         self,
@@ -74,6 +132,9 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         aiohttp_session: Optional[aiohttp.ClientSession] = None,
     ):
         super().__init__(synthesizer_config, aiohttp_session)
+        import azure.cognitiveservices.speech as speechsdk
+
+        self.speechsdk = speechsdk
         # Instantiates a client
         azure_speech_key = azure_speech_key or getenv("AZURE_SPEECH_KEY")
         azure_speech_region = azure_speech_region or getenv("AZURE_SPEECH_REGION")
@@ -85,51 +146,50 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
             raise ValueError(
                 "Please set AZURE_SPEECH_REGION environment variable or pass it as a parameter"
             )
-        speech_config = speechsdk.SpeechConfig(
+        speech_config = self.speechsdk.SpeechConfig(
             subscription=azure_speech_key, region=azure_speech_region
         )
         if self.synthesizer_config.audio_encoding == AudioEncoding.LINEAR16:
             if self.synthesizer_config.sampling_rate == 44100:
                 speech_config.set_speech_synthesis_output_format(
-                    speechsdk.SpeechSynthesisOutputFormat.Raw44100Hz16BitMonoPcm
+                    self.speechsdk.SpeechSynthesisOutputFormat.Raw44100Hz16BitMonoPcm
                 )
             if self.synthesizer_config.sampling_rate == 48000:
                 speech_config.set_speech_synthesis_output_format(
-                    speechsdk.SpeechSynthesisOutputFormat.Raw48Khz16BitMonoPcm
+                    self.speechsdk.SpeechSynthesisOutputFormat.Raw48Khz16BitMonoPcm
                 )
             if self.synthesizer_config.sampling_rate == 24000:
                 speech_config.set_speech_synthesis_output_format(
-                    speechsdk.SpeechSynthesisOutputFormat.Raw24Khz16BitMonoPcm
+                    self.speechsdk.SpeechSynthesisOutputFormat.Raw24Khz16BitMonoPcm
                 )
             elif self.synthesizer_config.sampling_rate == 16000:
                 speech_config.set_speech_synthesis_output_format(
-                    speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm
+                    self.speechsdk.SpeechSynthesisOutputFormat.Raw16Khz16BitMonoPcm
                 )
             elif self.synthesizer_config.sampling_rate == 8000:
                 speech_config.set_speech_synthesis_output_format(
-                    speechsdk.SpeechSynthesisOutputFormat.Raw8Khz16BitMonoPcm
+                    self.speechsdk.SpeechSynthesisOutputFormat.Raw8Khz16BitMonoPcm
                 )
         elif self.synthesizer_config.audio_encoding == AudioEncoding.MULAW:
             speech_config.set_speech_synthesis_output_format(
-                speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoMULaw
+                self.speechsdk.SpeechSynthesisOutputFormat.Raw8Khz8BitMonoMULaw
             )
-        self.synthesizer = speechsdk.SpeechSynthesizer(
+        self.synthesizer = self.speechsdk.SpeechSynthesizer(
             speech_config=speech_config, audio_config=None
         )
 
         self.voice_name = self.synthesizer_config.voice_name
         self.pitch = self.synthesizer_config.pitch
         self.rate = self.synthesizer_config.rate
-        self.thread_pool_executor = ThreadPoolExecutor(max_workers=1)
+        self.thread_pool_executor = ThreadPoolExecutor(
+            max_workers=AZURE_SYNTHESIZER_THREAD_POOL_SIZE
+        )
         self.logger = logger or logging.getLogger(__name__)
-
-
-    async def get_audio_data_from_cache_or_download(
-        self, phrase: BaseMessage, base_path: str
-    ) -> str:
-        cache_key = "-".join(
+        # (prefix, suffix) around the message text, keyed by whether the tailing silence is set
+        self.ssml_templates: Dict[bool, Tuple[str, str]] = {}
+        # everything in a cached audio file's name but the phrase text, which is fixed per synthesizer
+        self.audio_cache_key_suffix = "-".join(
             (
-                str(phrase.text),
                 str(self.synthesizer_config.type),
                 str(self.synthesizer_config.audio_encoding),
                 str(self.synthesizer_config.sampling_rate),
@@ -138,6 +198,11 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
                 str(self.rate),
             )
         )
+
+    async def get_audio_data_from_cache_or_download(
+        self, phrase: BaseMessage, base_path: str
+    ) -> str:
+        cache_key = f"{phrase.text}-{self.audio_cache_key_suffix}"
         filler_audio_path = os.path.join(base_path, f"{cache_key}.wav")
         if not os.path.exists(filler_audio_path):
             self.logger.debug(f"Generating cached audio for {phrase.text}")
@@ -147,8 +212,9 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
             )
             offset = self.synthesizer_config.sampling_rate * self.OFFSET_MS // 1000
             audio_data = result.audio_data[offset:]
-            with open(filler_audio_path, "wb") as wav:
-                wav.write(audio_data)
+            await asyncio.get_event_loop().run_in_executor(
+                None, write_audio_file, filler_audio_path, audio_data
+            )
             
         return filler_audio_path
 
@@ -160,21 +226,36 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
     ) -> List[FillerAudio]:
         if not os.path.exists(base_path):
             os.makedirs(base_path)
-        audios = []
-        for phrase in phrases:
-            audio_path = await self.get_audio_data_from_cache_or_download(
-                phrase, base_path
+        semaphore = asyncio.Semaphore(FILLER_AUDIO_SYNTHESIS_CONCURRENCY)
+
+        async def get_audio_data(phrase: BaseMessage) -> bytes:
+            async with semaphore:
+                audio_path = await self.get_audio_data_from_cache_or_download(
+                    phrase, base_path
+                )
+            # off the event loop, and not on thread_pool_executor where it would wait behind synthesis
+            return await asyncio.get_event_loop().run_in_executor(
+                None, read_audio_file, audio_path
+            )
+
+        # a repeated phrase would race on its own cache file, so each text is fetched once
+        unique_phrases = {phrase.text: phrase for phrase in phrases}
+        audio_datas = dict(
+            zip(
+                unique_phrases,
+                await asyncio.gather(*map(get_audio_data, unique_phrases.values())),
             )
-            audio_data = open(audio_path, "rb").read()
-            audio = FillerAudio(
+        )
+        return [
+            FillerAudio(
                 phrase,
-                audio_data=audio_data,
+                audio_data=audio_datas[phrase.text],
                 synthesizer_config=self.synthesizer_config,
                 is_interruptible=audio_is_interruptible,
                 seconds_per_chunk=2,
             )
-            audios.append(audio)
-        return audios
+            for phrase in phrases
+        ]
 
     async def get_phrase_filler_audios(
             self, filler_audio_config: FillerAudioConfig
@@ -183,42 +264,40 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         language = filler_audio_config.language
         filler_dict: Dict[str, List[str]] = filler_audio_config.filler_phrases.get(language)
         filler_phrase_list: List[BaseMessage] = self.make_filler_phrase_list(filler_dict)
-        audios: List[FillerAudio] = []
         filler_phrase_audios: Dict[str, List[FillerAudio]] = {}
-        for filler_phrase in filler_phrase_list:
-            cache_key = "-".join(
-                (
-                    str(filler_phrase.text),
-                    str(self.synthesizer_config.type),
-                    str(self.synthesizer_config.audio_encoding),
-                    str(self.synthesizer_config.sampling_rate),
-                    str(self.voice_name),
-                    str(self.pitch),
-                    str(self.rate),
-                )
-            )
+        semaphore = asyncio.Semaphore(FILLER_AUDIO_SYNTHESIS_CONCURRENCY)
+
+        async def get_filler_audio(filler_phrase: BaseMessage) -> FillerAudio:
+            cache_key = f"{filler_phrase.text}-{self.audio_cache_key_suffix}"
             filler_audio_path = os.path.join(self.base_filler_audio_path, f"{cache_key}.bytes")
             if os.path.exists(filler_audio_path):
-                audio_data = open(filler_audio_path, "rb").read()
+                audio_data = await asyncio.get_event_loop().run_in_executor(
+                    None, read_audio_file, filler_audio_path
+                )
             else:
                 self.logger.debug(f"Generating filler audio for {filler_phrase.text}")
                 ssml = self.create_ssml(filler_phrase.text)
-                result = await asyncio.get_event_loop().run_in_executor(
-                    self.thread_pool_executor, self.synthesizer.speak_ssml, ssml
-                )
+                async with semaphore:
+                    result = await asyncio.get_event_loop().run_in_executor(
+                        self.thread_pool_executor, self.synthesizer.speak_ssml, ssml
+                    )
                 offset = self.synthesizer_config.sampling_rate * self.OFFSET_MS // 1000
                 audio_data = result.audio_data[offset:]
-                with open(filler_audio_path, "wb") as f:
-                    f.write(audio_data)
-        
-            audio = FillerAudio(
+                await asyncio.get_event_loop().run_in_executor(
+                    None, write_audio_file, filler_audio_path, audio_data
+                )
+            return FillerAudio(
                 message=filler_phrase,
                 audio_data=audio_data,
                 synthesizer_config=self.synthesizer_config,
                 is_interruptible=True,
                 seconds_per_chunk=2
             )
-            audios.append(audio)
+
+        # make_filler_phrase_list dedupes the phrases, so no two of these share a cache file
+        audios: List[FillerAudio] = await asyncio.gather(
+            *map(get_filler_audio, filler_phrase_list)
+        )
 
         for key, phrase_text_list in filler_dict.items():
             filler_phrase_audios[key]: List = []
@@ -230,22 +309,56 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         return filler_phrase_audios
 
     def add_marks(self, message: str, index=0) -> str:
-        search_result = re.search(r"([\.\,\:\;\-\—]+)", message)
-        if search_result is None:
-            return message
-        start, end = search_result.span()
-        with_mark = message[:start] + f'<mark name="{index}" />' + message[start:end]
-        rest = message[end:]
-        rest_stripped = re.sub(r"^(.+)([\.\,\:\;\-\—]+)$", r"\1", rest)
-        if len(rest_stripped) == 0:
-            return with_mark
-        return with_mark + self.add_marks(rest_stripped, index + 1)
+        # single pass over message: each punctuation run gets a mark and, as the recursive
+        # version did, one trailing punctuation character is dropped from the rest after each mark
+        parts = []
+        pos, end = 0, len(message)
+        while True:
+            search_result = PUNCTUATION_RE.search(message, pos, end)
+            if search_result is None:
+                parts.append(message[pos:end])
+                break
+            start, mark_end = search_result.span()
+            parts.append(message[pos:start])
+            parts.append(f'<mark name="{index}" />')
+            parts.append(message[start:mark_end])
+            pos = mark_end
+            if end - pos >= 2 and PUNCTUATION_RE.match(message, end - 1, end):
+                end -= 1
+            if pos == end:
+                break
+            index += 1
+        return "".join(parts)
 
     def word_boundary_cb(self, evt, pool):
         pool.add(evt)
 
     def create_ssml(
         self, message: str, bot_sentiment: Optional[BotSentiment] = None
+    ) -> str:
+        # this ugly hack is necessary so we can limit the gap between sentences
+        # for normal sentences, it seems like the gap is > 500ms, so we're able to reduce it to 500ms
+        # for very tiny sentences, the API hangs - so we heuristically only update the silence gap
+        # if there is more than one word in the sentence
+        add_silence = " " in message
+        text = message.strip()
+        if (bot_sentiment and bot_sentiment.emotion) or not text:
+            return self.build_ssml(text, add_silence, bot_sentiment)
+        # without a sentiment the markup around the message is always the same,
+        # so it is serialized once and the escaped message is spliced into it
+        if add_silence not in self.ssml_templates:
+            prefix, suffix = self.build_ssml(SSML_TEXT_PLACEHOLDER, add_silence).split(
+                SSML_TEXT_PLACEHOLDER
+            )
+            self.ssml_templates[add_silence] = (prefix, suffix)
+        prefix, suffix = self.ssml_templates[add_silence]
+        return prefix + escape(text) + suffix
+
+    def build_ssml(
+        self,
+        text: str,
+        add_silence: bool,
+        bot_sentiment: Optional[BotSentiment] = None,
     ) -> str:
         voice_language_code = self.synthesizer_config.voice_name[:5]
         ssml_root = ElementTree.fromstring(
@@ -270,11 +383,7 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
                 "styledegree", str(bot_sentiment.degree * 2)
             )  # Azure specific, it's a scale of 0-2
             voice_root = styled
-        # this ugly hack is necessary so we can limit the gap between sentences
-        # for normal sentences, it seems like the gap is > 500ms, so we're able to reduce it to 500ms
-        # for very tiny sentences, the API hangs - so we heuristically only update the silence gap
-        # if there is more than one word in the sentence
-        if " " in message:
+        if add_silence:
             silence = ElementTree.SubElement(
                 voice_root, "{%s}silence" % NAMESPACES.get("mstts")
             )
@@ -283,15 +392,33 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         prosody = ElementTree.SubElement(voice_root, "prosody")
         prosody.set("pitch", f"{self.pitch}%")
         prosody.set("rate", f"{self.rate}%")
-        prosody.text = message.strip()
+        prosody.text = text
         return ElementTree.tostring(ssml_root, encoding="unicode")
 
-    def synthesize_ssml(self, ssml: str) -> speechsdk.AudioDataStream:
+    def cache_speech(
+        self,
+        speech_cache_key: Tuple[str, AudioEncoding, int],
+        audio_data_stream: "speechsdk.AudioDataStream",
+        audio_data: bytearray,
+        word_boundary_event_pool: WordBoundaryEventPool,
+    ):
+        # a cancelled or failed synthesis also ends the stream early, only keep complete audio
+        if (
+            audio_data_stream.status != self.speechsdk.StreamStatus.AllData
+            or len(audio_data) > self.SPEECH_CACHE_MAX_BYTES
+        ):
+            return
+        self.speech_cache[speech_cache_key] = (
+            bytes(audio_data),
+            list(word_boundary_event_pool.events),
+        )
+
+    def synthesize_ssml(self, ssml: str) -> "speechsdk.AudioDataStream":
         result = self.synthesizer.start_speaking_ssml_async(ssml).get()
-        return speechsdk.AudioDataStream(result)
+        return self.speechsdk.AudioDataStream(result)
 
     def ready_synthesizer(self):
-        connection = speechsdk.Connection.from_speech_synthesizer(self.synthesizer)
+        connection = self.speechsdk.Connection.from_speech_synthesizer(self.synthesizer)
         connection.open(True)
 
     # given the number of seconds the message was allowed to go until, where did we get in the message?
@@ -302,12 +429,11 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         seconds: float,
         word_boundary_event_pool: WordBoundaryEventPool,
     ) -> str:
-        events = word_boundary_event_pool.get_events_sorted()
-        for event in events:
-            if event["audio_offset"] > seconds:
-                ssml_fragment = ssml[: event["text_offset"]]
-                # TODO: this is a little hacky, but it works for now
-                return ssml_fragment.split(">")[-1]
+        event = word_boundary_event_pool.get_first_event_after(seconds)
+        if event is not None:
+            ssml_fragment = ssml[: event["text_offset"]]
+            # TODO: this is a little hacky, but it works for now
+            return ssml_fragment.split(">")[-1]
         return message
 
     async def create_speech(
@@ -323,57 +449,108 @@ class AzureSynthesizer(BaseSynthesizer[AzureSynthesizerConfig]):
         # Azure will return no audio for certain strings like "-", "[-", and "!"
         # which causes the `chunk_generator` below to hang. Return an empty
         # generator for these cases.
-        if not re.search(r"\w", message.text):
+        if not WORD_CHARACTER_RE.search(message.text):
             return SynthesisResult(
                 self.empty_generator(),
                 lambda _: message.text,
             )
 
+        ssml = (
+            message.ssml
+            if isinstance(message, SSMLMessage)
+            else self.create_ssml(message.text, bot_sentiment=bot_sentiment)
+        )
+        speech_cache_key = (
+            ssml,
+            self.synthesizer_config.audio_encoding,
+            self.synthesizer_config.sampling_rate,
+        )
+
         async def chunk_generator(
-            audio_data_stream: speechsdk.AudioDataStream, chunk_transform=lambda x: x
+            audio_data_stream: "speechsdk.AudioDataStream", chunk_transform=lambda x: x
         ):
+            synthesized_audio = bytearray()
+            # read_data fills the one audio_buffer in place, so each chunk handed out is a copy:
+            # output devices queue chunks, and the next chunk is read while this one plays
             audio_buffer = bytes(chunk_size)
-            filled_size = await asyncio.get_event_loop().run_in_executor(
-                self.thread_pool_executor,
-                lambda: audio_data_stream.read_data(audio_buffer),
+            audio_view = memoryview(audio_buffer)
+            loop = asyncio.get_event_loop()
+            filled_size = await loop.run_in_executor(
+                self.thread_pool_executor, audio_data_stream.read_data, audio_buffer
             )
+            synthesized_audio += audio_view[:filled_size]
             if filled_size != chunk_size:
+                self.cache_speech(
+                    speech_cache_key,
+                    audio_data_stream,
+                    synthesized_audio,
+                    word_boundary_event_pool,
+                )
                 yield SynthesisResult.ChunkResult(
-                    chunk_transform(audio_buffer[offset:]), True
+                    chunk_transform(bytes(audio_view[offset:])), True
                 )
                 return
             else:
                 yield SynthesisResult.ChunkResult(
-                    chunk_transform(audio_buffer[offset:]), False
+                    chunk_transform(bytes(audio_view[offset:])), False
                 )
             while True:
-                filled_size = audio_data_stream.read_data(audio_buffer)
+                # read_data blocks until the SDK has a full chunk, so keep it off the event loop
+                filled_size = await loop.run_in_executor(
+                    self.thread_pool_executor, audio_data_stream.read_data, audio_buffer
+                )
+                chunk = bytes(audio_view[: filled_size - offset])
+                synthesized_audio += chunk
                 if filled_size != chunk_size:
-                    yield SynthesisResult.ChunkResult(
-                        chunk_transform(audio_buffer[: filled_size - offset]), True
+                    self.cache_speech(
+                        speech_cache_key,
+                        audio_data_stream,
+                        synthesized_audio,
+                        word_boundary_event_pool,
                     )
+                    yield SynthesisResult.ChunkResult(chunk_transform(chunk), True)
                     break
-                yield SynthesisResult.ChunkResult(chunk_transform(audio_buffer), False)
+                yield SynthesisResult.ChunkResult(chunk_transform(chunk), False)
 
-        word_boundary_event_pool = WordBoundaryEventPool()
-        self.synthesizer.synthesis_word_boundary.connect(
-            lambda event: self.word_boundary_cb(event, word_boundary_event_pool)
-        )
-        ssml = (
-            message.ssml
-            if isinstance(message, SSMLMessage)
-            else self.create_ssml(message.text, bot_sentiment=bot_sentiment)
-        )
-        audio_data_stream = await asyncio.get_event_loop().run_in_executor(
-            self.thread_pool_executor, self.synthesize_ssml, ssml
-        )
+        async def cached_chunk_generator(audio_data: bytes, chunk_transform=lambda x: x):
+            num_full_chunks = len(audio_data) // chunk_size
+            for chunk_idx in range(num_full_chunks):
+                yield SynthesisResult.ChunkResult(
+                    chunk_transform(
+                        audio_data[chunk_idx * chunk_size : (chunk_idx + 1) * chunk_size]
+                    ),
+                    False,
+                )
+            yield SynthesisResult.ChunkResult(
+                chunk_transform(audio_data[num_full_chunks * chunk_size :]), True
+            )
+
+        speech_generator: Callable[
+            ..., AsyncGenerator[SynthesisResult.ChunkResult, None]
+        ]
+        cached_speech = self.speech_cache.get(speech_cache_key)
+        if cached_speech is not None:
+            self.logger.debug("Using cached speech for message")
+            audio_data, cached_events = cached_speech
+            word_boundary_event_pool = WordBoundaryEventPool(cached_events)
+            speech_generator = cached_chunk_generator
+            speech_source: Any = audio_data
+        else:
+            word_boundary_event_pool = WordBoundaryEventPool()
+            self.synthesizer.synthesis_word_boundary.connect(
+                lambda event: self.word_boundary_cb(event, word_boundary_event_pool)
+            )
+            speech_generator = chunk_generator
+            speech_source = await asyncio.get_event_loop().run_in_executor(
+                self.thread_pool_executor, self.synthesize_ssml, ssml
+            )
         if self.synthesizer_config.should_encode_as_wav:
-            output_generator = chunk_generator(
-                audio_data_stream,
+            output_generator = speech_generator(
+                speech_source,
                 lambda chunk: encode_as_wav(chunk, self.synthesizer_config),
             )
         else:
-            output_generator = chunk_generator(audio_data_stream)
+            output_generator = speech_generator(speech_source)
 
         return SynthesisResult(
             output_generator,
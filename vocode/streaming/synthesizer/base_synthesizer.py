@@ -1,5 +1,6 @@
 import asyncio
 import os
+from contextlib import AsyncExitStack
 import __main__
 from typing import (
     Any,
@@ -18,7 +19,6 @@ import math
 import io
 import wave
 import aiohttp
-from  aiobotocore.session import get_session
 from nltk.tokenize import word_tokenize
 from nltk.tokenize.treebank import TreebankWordDetokenizer
 from opentelemetry import trace
@@ -151,8 +151,33 @@ class BaseSynthesizer(Generic[SynthesizerConfigType]):
         else:
             self.aiohttp_session = aiohttp.ClientSession()
             self.should_close_session_on_tear_down = True
-        
-        self.aiobotocore_session = get_session()
+
+        self._aiobotocore_session = None
+        self._s3_client = None
+        self._s3_client_exit_stack: Optional[AsyncExitStack] = None
+        self._s3_client_lock = asyncio.Lock()
+
+    @property
+    def aiobotocore_session(self):
+        # aiobotocore pulls in botocore, so only import it once S3 is actually used
+        if self._aiobotocore_session is None:
+            from aiobotocore.session import get_session
+
+            self._aiobotocore_session = get_session()
+        return self._aiobotocore_session
+
+    async def get_s3_client(self):
+        """Returns an S3 client that is reused by every lookup of this synthesizer
+        and closed on tear_down, instead of opening a new connection pool per request"""
+        async with self._s3_client_lock:
+            if self._s3_client is None:
+                from vocode.streaming.utils.aws_s3 import s3_config
+
+                self._s3_client_exit_stack = AsyncExitStack()
+                self._s3_client = await self._s3_client_exit_stack.enter_async_context(
+                    self.aiobotocore_session.create_client("s3", config=s3_config)
+                )
+        return self._s3_client
 
     async def empty_generator(self):
         yield SynthesisResult.ChunkResult(b"", True)
@@ -399,6 +424,10 @@ class BaseSynthesizer(Generic[SynthesizerConfigType]):
     async def tear_down(self):
         if self.should_close_session_on_tear_down:
             await self.aiohttp_session.close()
+        if self._s3_client_exit_stack is not None:
+            await self._s3_client_exit_stack.aclose()
+            self._s3_client_exit_stack = None
+            self._s3_client = None
 
     def get_cache_key(self, text: str) -> str:
         return self.synthesizer_config.get_cache_key(text)
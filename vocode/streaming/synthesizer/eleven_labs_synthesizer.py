@@ -11,7 +11,6 @@ from opentelemetry.trace import Span, set_span_in_context
 from pydub import AudioSegment
 from langchain.docstore.document import Document
 import base64
-from botocore.client import Config
 from vocode import getenv
 from vocode.streaming.synthesizer.base_synthesizer import (
     # BaseSynthesizer, # this wont reflect the changes in the base_synthesizer.py when editing
@@ -36,7 +35,6 @@ from vocode.streaming.utils.mp3_helper import decode_mp3
 from vocode.streaming.synthesizer.miniaudio_worker import MiniaudioWorker
 from vocode.streaming.synthesizer.base_synthesizer import BaseSynthesizer
 
-from vocode.streaming.utils.aws_s3 import load_from_s3, load_from_s3_async
 from vocode.streaming.utils.cache import RedisRenewableTTLCache
 
 ADAM_VOICE_ID = "pNInz6obpgDQGcFmaJgB"
@@ -44,8 +42,6 @@ ELEVEN_LABS_BASE_URL = "https://api.elevenlabs.io/v1/"
 
 SIMILARITY_THRESHOLD = 0.98
 
-s3_config = Config(s3={"use_accelerate_endpoint": True})
-
 
 class ElevenLabsSynthesizer(BaseSynthesizer[ElevenLabsSynthesizerConfig]):
     def __init__(
@@ -233,17 +229,16 @@ class ElevenLabsSynthesizer(BaseSynthesizer[ElevenLabsSynthesizerConfig]):
                 self.logger.debug(f"Original text: {message.text}")
                 index_message = BaseMessage(text=text_message)
                 try:
+                    from vocode.streaming.utils.aws_s3 import load_from_s3_async
+
                     s3_span = tracer.start_span(
                         f"synthesizer.{SynthesizerType.ELEVEN_LABS.value.split('_', 1)[-1]}.s3"
                     )
-                    async with self.aiobotocore_session.create_client(
-                        "s3", config=s3_config
-                    ) as _s3:
-                        audio_data = await load_from_s3_async(
-                            bucket_name=self.bucket_name,
-                            object_key=object_id,
-                            s3_client=_s3,
-                        )
+                    audio_data = await load_from_s3_async(
+                        bucket_name=self.bucket_name,
+                        object_key=object_id,
+                        s3_client=await self.get_s3_client(),
+                    )
                     s3_span.end()
                 except Exception as e:
                     self.logger.debug(f"Error loading object from S3: {str(e)}")
@@ -2,7 +2,6 @@ from typing import Dict, Any, List
 from langchain.docstore.document import Document
 from vocode.streaming.models.index_config import IndexConfig
 from vocode.streaming.vector_db.pinecone import PineconeDB
-from vocode.streaming.utils.aws_s3 import load_from_s3_async
 import logging
 
 from typing import Any, Dict
@@ -62,13 +61,8 @@ async def load_index_cache(
     ):
     import base64 
     import asyncio
-    from botocore.client import Config
-    config = Config(
-        s3 = {
-        'use_accelerate_endpoint': True
-        }
-    )
     from aiobotocore.session import get_session
+    from vocode.streaming.utils.aws_s3 import load_from_s3_async, s3_config
 
     logger = logger or logging.getLogger(__name__)
     logger.setLevel(logging.DEBUG)
@@ -122,7 +116,7 @@ async def load_index_cache(
         aiosession = get_session()
         logger.debug(f"Loading cache")
         for i, voice_id in enumerate(preloaded_vectors.keys()):        
-            async with aiosession.create_client('s3', config=config) as _s3: 
+            async with aiosession.create_client('s3', config=s3_config) as _s3: 
                 tasks = [load_from_s3_and_save_task(vector_db_cache, voice_id, doc, _s3)
                         for doc in preloaded_vectors[voice_id]]
                 await asyncio.gather(*tasks)
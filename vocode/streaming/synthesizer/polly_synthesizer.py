@@ -16,8 +16,6 @@ from vocode.streaming.synthesizer.base_synthesizer import (
 from vocode.streaming.models.synthesizer import PollySynthesizerConfig, SynthesizerType
 from vocode.streaming.utils.mp3_helper import decode_mp3
 
-import boto3
-
 
 class PollySynthesizer(BaseSynthesizer[PollySynthesizerConfig]):
     def __init__(
@@ -28,6 +26,8 @@ class PollySynthesizer(BaseSynthesizer[PollySynthesizerConfig]):
     ):
         super().__init__(synthesizer_config, aiohttp_session)
 
+        import boto3
+
         client = boto3.client("polly")
 
         # AWS Polly supports sampling rate of 8k and 16k for pcm output
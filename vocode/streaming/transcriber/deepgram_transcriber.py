@@ -1,11 +1,13 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import json
 import logging
 import time
 from typing import Optional
+import numpy as np
 import websockets
 from websockets.client import WebSocketClientProtocol
-import audioop
 from urllib.parse import urlencode, quote
 from vocode import getenv
 
@@ -28,6 +30,14 @@ from vocode.streaming.models.audio_encoding import AudioEncoding
 
 PUNCTUATION_TERMINATORS = [".", "!", "?"]
 NUM_RESTARTS = 5
+# cap on the audio that queued up during a send and is coalesced into the next websocket frame
+MAX_AUDIO_BYTES_PER_SEND = 8192
+# audio backs up while Deepgram reconnects, and for good once it has given up restarting,
+# so past this many chunks (about a minute of 20ms chunks) the oldest ones are dropped
+MAX_QUEUED_AUDIO_CHUNKS = 3000
+# control messages, serialized once
+KEEP_ALIVE_MESSAGE = json.dumps({"type": "KeepAlive"})
+CLOSE_STREAM_MESSAGE = json.dumps({"type": "CloseStream"})
 
 
 avg_latency_hist = meter.create_histogram(
@@ -67,6 +77,27 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
         self.is_ready = False
         self.logger = logger or logging.getLogger(__name__)
         self.audio_cursor = 0.0
+        # only LINEAR16 input is downsampled, see send_audio
+        self.downsampling_factor = (
+            self.transcriber_config.downsampling
+            if self.transcriber_config.audio_encoding == AudioEncoding.LINEAR16
+            else None
+        )
+        # the detector is stateful, so its frames are run one at a time and in order
+        self.vad_executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1)
+            if self.transcriber_config.voice_activity_detector_config
+            else None
+        )
+        self.dropping_audio = False
+        num_channels = 1
+        sample_width = 2
+        # audio_cursor advances by this much per byte sent
+        self.seconds_per_audio_byte = 1 / (
+            self.transcriber_config.sampling_rate * num_channels * sample_width
+        )
+        # the url only depends on the config, so reconnects reuse the one built for the first connection
+        self.deepgram_url: Optional[str] = None
 
     async def _run_loop(self):
         try:
@@ -83,26 +114,29 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
             return
 
     def send_audio(self, chunk):
-        if (
-            self.transcriber_config.downsampling
-            and self.transcriber_config.audio_encoding == AudioEncoding.LINEAR16
-        ):
-            chunk, _ = audioop.ratecv(
-                chunk,
-                2,
-                1,
-                self.transcriber_config.sampling_rate
-                * self.transcriber_config.downsampling,
-                self.transcriber_config.sampling_rate,
-                None,
-            )
+        if self.downsampling_factor:
+            # keeps every nth sample, which is byte for byte what audioop.ratecv did
+            # for an integer ratio with fresh state, without its per-sample loop
+            chunk = np.frombuffer(chunk, dtype=np.int16)[
+                :: self.downsampling_factor
+            ].tobytes()
+        if self.input_queue.qsize() >= MAX_QUEUED_AUDIO_CHUNKS:
+            if not self.dropping_audio:
+                self.logger.warning(
+                    "Deepgram is not keeping up, dropping the oldest queued audio"
+                )
+                self.dropping_audio = True
+            self.input_queue.get_nowait()
+        else:
+            self.dropping_audio = False
         super().send_audio(chunk)
 
     async def terminate(self):
-        terminate_msg = json.dumps({"type": "CloseStream"})
-        self.input_queue.put_nowait(terminate_msg)
+        self.input_queue.put_nowait(CLOSE_STREAM_MESSAGE)
         self._ended = True
         self._task.cancel()
+        if self.vad_executor is not None:
+            self.vad_executor.shutdown(wait=False)
         super().terminate()
 
     def get_deepgram_url(self):
@@ -196,46 +230,71 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
                 if not self.received_first_audio:
                     self.logger.debug("Deepgram sender: sent first audio")
                 self.received_first_audio = True
+                # audio that arrived while the last frame was being sent goes out in one frame,
+                # anything else queued (i.e. the CloseStream message) is sent right after it
+                frames = [data]
+                control_message = None
+                if isinstance(data, bytes):
+                    num_bytes = len(data)
+                    while (
+                        num_bytes < MAX_AUDIO_BYTES_PER_SEND
+                        and not self.input_queue.empty()
+                    ):
+                        item = self.input_queue.get_nowait()
+                        if not isinstance(item, bytes):
+                            control_message = item
+                            break
+                        frames.append(item)
+                        num_bytes += len(item)
+                    if len(frames) > 1:
+                        data = b"".join(frames)
                 if self.transcriber_config.voice_activity_detector_config:
                     # when using WebRTC VAD, there are too many false positive that break the conversation flow
-                    self.logger.debug(f"Using voice activity detector.")
-                    try:
-                        # TODO: make this async
-                        start_time = time.time()
-                        if self.voice_activity_detector.should_interrupt(data):
-                            self.logger.debug(f"VAD detected - took {time.time() - start_time:.3f} seconds")
-                            self.output_queue.put_nowait(
-                                Transcription(
-                                    message=HUMAN_ACTIVITY_DETECTED,
-                                    confidence=1,
-                                    is_final=True,
-                                )
-                            )
-                        
-                    except Exception as e:
-                        self.logger.debug(f"Error in voice activity detector: {repr(e)}")
+                    self.logger.debug("Using voice activity detector.")
+                    # the detector runs off the event loop and the audio is sent without waiting on it,
+                    # it still gets the audio frame by frame
+                    for frame in frames:
+                        asyncio.get_event_loop().run_in_executor(
+                            self.vad_executor,
+                            self.voice_activity_detector.should_interrupt,
+                            frame,
+                        ).add_done_callback(
+                            partial(self.on_voice_activity_detected, time.time())
+                        )
             except asyncio.exceptions.TimeoutError:
                 if not self.received_first_audio:
                     self.logger.debug("Deepgram sender: sending KeepAlive")
-                    await ws.send(json.dumps({"type": "KeepAlive"}))
+                    await ws.send(KEEP_ALIVE_MESSAGE)
                     continue
                 if self._ended:
                     self.logger.debug("Deepgram sender: sending CloseStream")
-                    terminate_msg = json.dumps({"type": "CloseStream"})
-                    await ws.send(terminate_msg)
+                    await ws.send(CLOSE_STREAM_MESSAGE)
                     continue
                 break
-            num_channels = 1
-            sample_width = 2
-            self.audio_cursor += len(data) / (
-                self.transcriber_config.sampling_rate
-                * num_channels
-                * sample_width
-            )
+            self.audio_cursor += len(data) * self.seconds_per_audio_byte
             await ws.send(data)
+            if control_message is not None:
+                await ws.send(control_message)
         self.logger.debug("Terminating Deepgram transcriber sender")
         return
 
+    def on_voice_activity_detected(self, start_time: float, should_interrupt: asyncio.Future):
+        # frames already queued on vad_executor still run after terminate, drop their results
+        if self._ended or should_interrupt.cancelled():
+            return
+        try:
+            if should_interrupt.result():
+                self.logger.debug(f"VAD detected - took {time.time() - start_time:.3f} seconds")
+                self.output_queue.put_nowait(
+                    Transcription(
+                        message=HUMAN_ACTIVITY_DETECTED,
+                        confidence=1,
+                        is_final=True,
+                    )
+                )
+        except Exception as e:
+            self.logger.debug(f"Error in voice activity detector: {repr(e)}")
+
     async def receiver(self, ws: WebSocketClientProtocol):
         buffer = ""
         buffer_avg_confidence = 0
@@ -243,6 +302,15 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
         time_silent = 0
         transcript_cursor = 0.0
         sent_vad_transcription = False
+        # fixed for the lifetime of the connection
+        minimum_speaking_duration_to_interrupt = (
+            self.transcriber_config.minimum_speaking_duration_to_interrupt
+        )
+        interruption_word_threshold = self.transcriber_config.interruption_word_threshold
+        min_interim_transcription_interval_seconds = (
+            self.transcriber_config.min_interim_transcription_interval_seconds
+        )
+        last_interim_transcription_time = 0.0
         while not self._ended:
             try:
                 msg = await ws.recv()
@@ -265,14 +333,16 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
                 self.logger.debug(f"Deepgram: received final transcription - _ended:{self._ended}")
                 self._ended = True
                 break
-            cur_max_latency = self.audio_cursor - transcript_cursor
-            transcript_cursor = data["start"] + data["duration"]
-            cur_min_latency = self.audio_cursor - transcript_cursor
+            duration = data["duration"]
+            audio_cursor = self.audio_cursor
+            cur_max_latency = audio_cursor - transcript_cursor
+            transcript_cursor = data["start"] + duration
+            cur_min_latency = audio_cursor - transcript_cursor
 
             avg_latency_hist.record(
-                (cur_min_latency + cur_max_latency) / 2 * data["duration"]
+                (cur_min_latency + cur_max_latency) / 2 * duration
             )
-            duration_hist.record(data["duration"])
+            duration_hist.record(duration)
 
             # Log max and min latencies
             max_latency_hist.record(cur_max_latency)
@@ -281,10 +351,11 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
             is_final = data["is_final"]
             speech_final = self.is_speech_final(buffer, data, time_silent)
             top_choice = data["channel"]["alternatives"][0]
+            transcript = top_choice["transcript"]
             confidence = top_choice["confidence"]
 
-            if top_choice["transcript"] and confidence > 0.0 and is_final:
-                buffer = f"{buffer} {top_choice['transcript']}"
+            if transcript and confidence > 0.0 and is_final:
+                buffer = f"{buffer} {transcript}"
                 if buffer_avg_confidence == 0:
                     buffer_avg_confidence = confidence
                 else:
@@ -308,8 +379,8 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
                 time_silent = 0
                 sent_vad_transcription = False
             elif (
-                data["duration"] > self.transcriber_config.minimum_speaking_duration_to_interrupt
-                and len(top_choice["words"])> self.transcriber_config.interruption_word_threshold
+                duration > minimum_speaking_duration_to_interrupt
+                and len(top_choice["words"])> interruption_word_threshold
                 and not sent_vad_transcription
             ):
                 self.logger.debug("Sending VAD transcription")
@@ -322,17 +393,23 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
                 )
                 sent_vad_transcription = True
                 time_silent = self.calculate_time_silent(data)
-            elif top_choice["transcript"] and confidence > 0.0:
-                self.output_queue.put_nowait(
-                    Transcription(
-                        message=buffer,
-                        confidence=confidence,
-                        is_final=False,
+            elif transcript and confidence > 0.0:
+                now = time.monotonic()
+                if (
+                    now - last_interim_transcription_time
+                    >= min_interim_transcription_interval_seconds
+                ):
+                    last_interim_transcription_time = now
+                    self.output_queue.put_nowait(
+                        Transcription(
+                            message=buffer,
+                            confidence=confidence,
+                            is_final=False,
+                        )
                     )
-                )
                 time_silent = self.calculate_time_silent(data)
             else:
-                time_silent += data["duration"]
+                time_silent += duration
         self.logger.debug("Terminating Deepgram transcriber receiver")
         return
 
@@ -342,8 +419,11 @@ class DeepgramTranscriber(BaseAsyncTranscriber[DeepgramTranscriberConfig]):
             extra_headers = {"Authorization": f"Token {self.api_key}"}
             self.logger.debug(f"Connecting to Deepgram...")
             start_time = time.time()
+            if self.deepgram_url is None:
+                self.deepgram_url = self.get_deepgram_url()
+            # audio and short JSON transcripts don't compress enough to be worth deflating
             async with websockets.connect(
-                self.get_deepgram_url(), extra_headers=extra_headers
+                self.deepgram_url, extra_headers=extra_headers, compression=None
             ) as ws:
                 self.logger.debug(f"Connected to Deepgram! Connection took {time.time()-start_time:.2f} sec.")
                 self._task= asyncio.gather(self.sender(ws), self.receiver(ws))
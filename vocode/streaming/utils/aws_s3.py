@@ -4,15 +4,23 @@ import concurrent.futures
 import functools
 import asyncio
 
-config = Config(
+s3_config = Config(
     s3 = {
         'use_accelerate_endpoint': True
-    }
+    },
+    # clients are shared between concurrent lookups, so allow fanning out
+    max_pool_connections=50,
+    retries={'max_attempts': 3},
 )
-_s3 = boto3.client('s3', config=config)
 executor = concurrent.futures.ThreadPoolExecutor()
 from aiobotocore.session import get_session
 
+
+@functools.lru_cache(maxsize=None)
+def get_s3_client():
+    '''Builds the boto3 S3 client on first use instead of at import time'''
+    return boto3.client('s3', config=s3_config)
+
 def aio(f):
     '''Takes a synchronous function 
     and returns a corresponding async coroutine '''
@@ -22,15 +30,18 @@ def aio(f):
         return await loop.run_in_executor(executor, f_bound)
     return aio_wrapper
 
-get_object_async = aio(_s3.get_object)
+def get_object_body(bucket_name, object_key) -> bytes:
+    response = get_s3_client().get_object(Bucket=bucket_name, Key=object_key)
+    return response["Body"].read()
 
 async def load_from_s3(bucket_name, object_key):
     try:
-        response = await get_object_async(
-            Bucket=bucket_name,
-            Key=object_key,
+        # the body is streamed from S3 as it is read, so the read runs on the executor too
+        get_object_body_async = aio(get_object_body)
+        return await get_object_body_async(
+            bucket_name=bucket_name,
+            object_key=object_key,
         )
-        return response["Body"].read()
     except Exception as e:
         raise Exception(f"Error loading object from S3: {str(e)}")
     
@@ -9,7 +9,6 @@ from vocode.streaming.models.synthesizer import (
     ElevenLabsSynthesizerConfig
 )
 from vocode.streaming.vector_db.pinecone import PineconeDB
-from vocode.streaming.utils.aws_s3 import load_from_s3_async
 import logging
 
 DAYS_TO_KEEP = 4
@@ -68,13 +67,8 @@ class RedisRenewableTTLCache:
     ):
         import base64 
         import asyncio
-        from botocore.client import Config
-        config = Config(
-            s3 = {
-            'use_accelerate_endpoint': True
-            }
-        )
         from aiobotocore.session import get_session
+        from vocode.streaming.utils.aws_s3 import load_from_s3_async, s3_config
 
         logger = logger or logging.getLogger(__name__)
         logger.setLevel(logging.DEBUG)
@@ -127,7 +121,7 @@ class RedisRenewableTTLCache:
 
         try:
             aiosession = get_session()
-            async with aiosession.create_client('s3', config=config) as _s3: 
+            async with aiosession.create_client('s3', config=s3_config) as _s3: 
                 tasks = [
                     load_from_s3_and_save_task(self, doc, _s3)
                     for doc in preloaded_vectors
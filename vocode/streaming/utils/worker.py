@@ -95,6 +95,12 @@ class AsyncQueueWorker(AsyncWorker):
             except asyncio.CancelledError:
                 return
             except Exception as e:
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    # the pending task is being destroyed after its loop closed: every
+                    # retry of input_queue.get() would fail immediately and spin forever
+                    return
                 logger.exception("AsyncQueueWorker", exc_info=True)
 
     async def process(self, item):
@@ -166,6 +172,30 @@ class InterruptibleEventFactory:
 InterruptibleEventType = TypeVar("InterruptibleEventType", bound=InterruptibleEvent)
 
 
+QueueItemType = TypeVar("QueueItemType", bound=InterruptibleEvent)
+
+
+class PayloadCountingQueue(asyncio.Queue, Generic[QueueItemType]):
+    """asyncio.Queue of interruptible events that keeps track of how many queued
+    events carry a payload of payload_type, so callers don't have to scan the queue"""
+
+    def __init__(self, payload_type: type, maxsize: int = 0):
+        super().__init__(maxsize)
+        self.payload_type = payload_type
+        self.payload_count = 0
+
+    def _put(self, item: QueueItemType):
+        if isinstance(item.payload, self.payload_type):
+            self.payload_count += 1
+        super()._put(item)
+
+    def _get(self) -> QueueItemType:
+        item = super()._get()
+        if isinstance(item.payload, self.payload_type):
+            self.payload_count -= 1
+        return item
+
+
 class InterruptibleWorker(AsyncWorker[InterruptibleEventType]):
     def __init__(
         self,
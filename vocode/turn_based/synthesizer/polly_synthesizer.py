@@ -2,7 +2,6 @@ import io
 from pydub import AudioSegment
 from vocode.turn_based.synthesizer.base_synthesizer import BaseSynthesizer
 
-import boto3
 
 DEFAULT_SAMPLING_RATE = 16000
 DEFAULT_LANGUAGE_CODE = "en-US"
@@ -16,6 +15,8 @@ class PollySynthesizer(BaseSynthesizer):
         language_code: str = DEFAULT_LANGUAGE_CODE,
         voice_id: str = DEFAULT_VOICE_ID,
     ):
+        import boto3
+
         client = boto3.client("polly")
 
         # AWS Polly supports sampling rate of 8k and 16k for pcm output